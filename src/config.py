@@ -7,6 +7,7 @@ SILENCE_THRESHOLD = 0.015  # Adjust this value based on your environment
 SILENCE_DURATION = 2.0  # Seconds of silence to consider speech ended
 MIN_SPEECH_DURATION = 1.0  # Minimum duration of speech to consider valid
 WHISPER_MODEL = "turbo"
+WHISPER_BACKEND = "openai"  # or "faster" for faster-whisper (CTranslate2)
 ANTHROPIC_MODEL_NAME = "claude-sonnet-4-20250514"
 OPENAI_MODEL_NAME = "gpt-4o"
 OLLAMA_MODEL_NAME = "llama3.2"
@@ -24,6 +25,7 @@ class Config:
     ollama_port: str
     ollama_model: str
     whisper_model: str
+    whisper_backend: str
     silence_threshold: float
     silence_duration: float
     min_speech_duration: float
@@ -39,6 +41,7 @@ class Config:
         ollama_port = os.getenv("OLLAMA_PORT", "")
         ollama_model = os.getenv("OLLAMA_MODEL", OLLAMA_MODEL_NAME)
         whisper = os.getenv("WHISPER_MODEL", WHISPER_MODEL)
+        whisper_backend = os.getenv("WHISPER_BACKEND", WHISPER_BACKEND)
         silence_thresh = float(os.getenv("SILENCE_THRESHOLD", SILENCE_THRESHOLD))
         silence_dur = float(os.getenv("SILENCE_DURATION", SILENCE_DURATION))
         min_speech = float(os.getenv("MIN_SPEECH_DURATION", MIN_SPEECH_DURATION))
@@ -53,6 +56,7 @@ class Config:
             ollama_port=ollama_port,
             ollama_model=ollama_model,
             whisper_model=whisper,
+            whisper_backend=whisper_backend,
             silence_threshold=silence_thresh,
             silence_duration=silence_dur,
             min_speech_duration=min_speech,
@@ -77,4 +81,7 @@ class Config:
                 "Please set the OLLAMA_PORT and OLLAMA_MODEL environment variable."
             )
 
+        if self.whisper_backend not in ("openai", "faster"):
+            raise ValueError("WHISPER_BACKEND must be either 'openai' or 'faster'.")
+
         return self
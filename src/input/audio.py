@@ -8,7 +8,8 @@ import pyaudio
 import soundfile as sf
 import webrtcvad
 
-INT16_MAX = 32768
+from input.audio_kernels import pcm16_to_f32_and_rms
+
 CHUNK = 960  # 1024  # Must be larger than processing time.
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
@@ -34,6 +35,8 @@ class AudioInput:
         silence_threshold=0.015,
     ):
         frames = []
+        # float32 copies of frames, converted while each chunk is measured
+        samples = []
         silent_chunks = 0
         is_speaking = False
 
@@ -58,21 +61,26 @@ class AudioInput:
             # Wait for a bit to avoid blocking
             await asyncio.sleep(0.02)
 
+            # Filled with float32 samples while the silence check runs
+            chunk = np.empty(len(audio_data) // 2, dtype=np.float32)
+
             # If we detect sound
-            # if not _is_silence(audio_data, silence_threshold):
-            if self.is_speaking(audio_data, silence_threshold):
+            if self.is_speaking(audio_data, silence_threshold, out=chunk):
                 is_speaking = True
                 silent_chunks = 0
                 frames.append(audio_data)
+                samples.append(chunk)
             # If we detect silence after speech
             elif is_speaking:
                 frames.append(audio_data)
+                samples.append(chunk)
                 silent_chunks += 1
 
                 # If silence duration exceeds our threshold, stop recording
                 if silent_chunks * CHUNK / RATE > silence_duration:
                     if len(frames) * CHUNK / RATE < min_speech_duration:
                         frames = []
+                        samples = []
                         is_speaking = False
                         continue
                     break
@@ -81,23 +89,20 @@ class AudioInput:
 
         # If we captured some speech
         if frames and is_speaking:
-            # Convert frames to audio buffer
-            audio_buffer = b"".join(frames)
             if self.debug:
-                _dump_audio(audio_buffer)
+                _dump_audio(b"".join(frames))
 
-            # Convert to numpy array for Whisper - use float32 to match Whisper's expected dtype
-            audio_array = (
-                np.frombuffer(audio_buffer, dtype=np.int16).astype(np.float32)
-                / INT16_MAX
-            )
+            # float32 samples for Whisper, already scaled chunk by chunk
+            audio_array = np.concatenate(samples)
 
             # Process with Whisper
             await self.audio_data.set(audio_array)
 
-    def is_speaking(self, audio_data: bytes, silence_threshold: float) -> bool:
+    def is_speaking(
+        self, audio_data: bytes, silence_threshold: float, out=None
+    ) -> bool:
         is_speech: bool = False
-        if _is_silence(audio_data, silence_threshold):
+        if _is_silence(audio_data, silence_threshold, out=out):
             return False
         try:
             is_speech = self.vad.is_speech(audio_data, RATE)
@@ -123,24 +128,22 @@ def _dump_audio(audio_data: bytes):
     sf.write(filename, np.frombuffer(audio_data, dtype=np.int16), RATE)
 
 
-def _is_silence(audio_data: bytes, threshold: float) -> bool:
+def _is_silence(audio_data: bytes, threshold: float, out=None) -> bool:
     """
     Determine if the audio chunk is silence based on amplitude threshold.
     Args:
     audio_data (bytes): Raw audio data of int16 samples
-    threshold (float): RMS amplitude threshold
+    threshold (float): RMS amplitude threshold, relative to full scale
+    out (np.ndarray): Optional float32 buffer that receives the scaled samples
     Returns:
     bool: True if silence, False otherwise
     """
 
-    # Convert audio data to numpy array
+    # Zero-copy view of the raw bytes, scaled and measured in one pass
     audio_array = np.frombuffer(audio_data, dtype=np.int16)
+    if out is None:
+        out = np.empty(len(audio_array), dtype=np.float32)
+    rms = pcm16_to_f32_and_rms(audio_array, out)
 
-    # Check if array is empty or contains only zeros
-    if len(audio_array) == 0 or np.all(audio_array == 0):
-        return True
-
-    # Calculate the RMS value (Use float32 to avoid overflow)
-    mn = np.mean(np.square(audio_array.astype(np.float32)))
-    rms: float = np.sqrt(mn)
-    return rms < INT16_MAX * threshold
+    # All-zero audio is silence regardless of threshold
+    return rms == 0.0 or rms < threshold
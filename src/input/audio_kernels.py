@@ -0,0 +1,29 @@
+import math
+
+import numpy as np
+from numba import njit
+
+PCM16_SCALE = 1.0 / 32768.0  # int16 PCM to [-1, 1)
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def pcm16_to_f32_and_rms(src: np.ndarray, dst: np.ndarray) -> float:
+    """
+    Scale int16 PCM into a float32 buffer and measure its RMS in one pass.
+    Args:
+    src (np.ndarray): int16 samples
+    dst (np.ndarray): float32 output, at least as long as src
+    Returns:
+    float: RMS amplitude of the scaled samples in [0, 1]
+    """
+    n = src.shape[0]
+    if n == 0:
+        return 0.0
+
+    # Accumulate in float64; int16 scaled by 2**-15 is exact in float32
+    acc = 0.0
+    for i in range(n):
+        v = src[i] * PCM16_SCALE
+        dst[i] = v
+        acc += v * v
+    return math.sqrt(acc / n)
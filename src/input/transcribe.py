@@ -1,16 +1,19 @@
 import logging
+from math import gcd
 from typing import Optional, Protocol
 
 import numpy as np
-import pyaudio
+import torch
 import whisper
+from scipy.signal import resample_poly
 
 CHUNK = 8196  # Must be larger than processing time.
-FORMAT = pyaudio.paInt16
 CHANNELS = 1
 RATE = 44100
 SILENCE_THRESHOLD = 500  # Adjust this value based on your environment
 SILENCE_DURATION = 1.5  # Seconds of silence to consider speech ended
+WHISPER_RATE = whisper.audio.SAMPLE_RATE  # 16kHz
+PCM16_SCALE = np.float32(1.0 / 32768.0)  # int16 PCM to [-1, 1)
 
 logger = logging.getLogger(__name__)
 
@@ -26,46 +29,142 @@ class Transcriber:
     def __init__(self, model_name="turbo", force_language=None):
         self.model = whisper.load_model(model_name)
         self.force_language = force_language
+        # Load the mel filterbank onto the model device once (lru_cached by whisper)
+        whisper.audio.mel_filters(self.model.device, self.model.dims.n_mels)
+        # Half precision halves encoder memory traffic, but is CUDA only
+        self._fp16 = self.model.device.type == "cuda"
+        if self._fp16:
+            self._compile_encoder()
+        # Reusable 30s input window, padded with zeros
+        self._pinned = self.model.device.type == "cuda"
+        if self._pinned:
+            # Page-locked for faster host-to-device copies; the numpy view
+            # shares its memory, so samples are written straight into it
+            self._audio = torch.zeros(
+                whisper.audio.N_SAMPLES, dtype=torch.float32
+            ).pin_memory()
+            self._buf = self._audio.numpy()
+        else:
+            self._buf = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+            # Shares memory with the numpy buffer
+            self._audio = torch.from_numpy(self._buf)
 
+    @torch.inference_mode()
+    def _compile_encoder(self):
+        """
+        Compile the encoder into fused kernels captured as a CUDA graph.
+
+        The padded 30s window fixes the mel shape, so a single graph is
+        specialized. It is warmed up here rather than on the first utterance.
+        """
+        self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead")
+        mel = torch.zeros(
+            1,
+            self.model.dims.n_mels,
+            whisper.audio.N_FRAMES,
+            dtype=torch.float16,
+            device=self.model.device,
+        )
+        self.model.encoder(mel)
+
+    @torch.inference_mode()
     def transcribe_buffer(self, audio_array, sample_rate) -> str | None:
         """
         Transcribe audio directly from buffer without saving to file.
+
+        Accepts float samples in [-1, 1] or raw int16 PCM.
         """
+        # int16 PCM is scaled while it is copied into the input window
+        is_pcm16 = audio_array.dtype == np.int16
+
         # Resample if needed (Whisper expects 16kHz)
-        if sample_rate != 16000:
-            # Simple resampling - in production you might want to use a proper resampling library
-            target_length = int(len(audio_array) * 16000 / sample_rate)
-            audio_array = np.interp(
-                np.linspace(0, len(audio_array), target_length),
-                np.arange(0, len(audio_array)),
-                audio_array,
+        if sample_rate != WHISPER_RATE:
+            # Polyphase FIR resampling, anti-aliased and run in C
+            g = gcd(WHISPER_RATE, sample_rate)
+            audio_array = resample_poly(
+                audio_array, WHISPER_RATE // g, sample_rate // g
             )
 
-        # Pad or trim to fit Whisper's expected input
-        audio_array = audio_array.astype(np.float32)
-        # logger.debug(f"Audio shape: {audio_array.shape} type: {audio_array.dtype}")
-        audio_array = whisper.pad_or_trim(audio_array)
-        # logger.debug(f"Audio shape: {audio_array.shape} type: {audio_array.dtype}")
+        # Pad or trim to fit Whisper's expected input, casting to float32
+        n = min(len(audio_array), whisper.audio.N_SAMPLES)
+        if is_pcm16:
+            # Fused scale and cast in a single pass
+            np.multiply(audio_array[:n], PCM16_SCALE, out=self._buf[:n])
+        else:
+            self._buf[:n] = audio_array[:n]
+        self._buf[n:] = 0
 
-        # Make log-Mel spectrogram
-        mel = whisper.log_mel_spectrogram(
-            audio_array, n_mels=self.model.dims.n_mels
-        ).to(self.model.device)
-        # logger.debug(f"Mel shape: {mel.shape} type: {mel.dtype}")
+        # A pinned window is copied without blocking; the copy is ordered
+        # before the spectrogram on the same CUDA stream
+        audio = self._audio.to(self.model.device, non_blocking=self._pinned)
 
-        # Detect language
-        _, probs = self.model.detect_language(mel)
-        detected_language = max(probs, key=probs.get)
-        logger.info(f"Detected language: {detected_language}")
-        if detected_language not in ("en", "ja"):
-            logger.warning(f"Unsupported language: {detected_language}")
-            return None
+        # Make log-Mel spectrogram directly on the model device
+        mel = whisper.log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels)
+        # logger.debug(f"Mel shape: {mel.shape} type: {mel.dtype}")
 
         if self.force_language:
+            # No need to run the extra encoder pass for language detection
             detected_language = self.force_language
+        else:
+            # Detect language
+            _, probs = self.model.detect_language(mel)
+            detected_language = max(probs, key=probs.get)
+            logger.info(f"Detected language: {detected_language}")
+            if detected_language not in ("en", "ja"):
+                logger.warning(f"Unsupported language: {detected_language}")
+                return None
 
         # Decode the audio
-        options = whisper.DecodingOptions(language=detected_language, fp16=False)
+        options = whisper.DecodingOptions(language=detected_language, fp16=self._fp16)
         result = whisper.decode(self.model, mel, options)
 
         return str(result.text)
+
+
+class FasterWhisperTranscriber:
+    """
+    Transcriber backed by faster-whisper (CTranslate2) with int8 weights.
+    """
+
+    def __init__(self, model_name="turbo", force_language=None):
+        # Optional dependency, only needed for this backend
+        from faster_whisper import WhisperModel
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        self.model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        self.force_language = force_language
+
+    def transcribe_buffer(self, audio_array, sample_rate) -> str | None:
+        """
+        Transcribe audio directly from buffer without saving to file.
+
+        Accepts float samples in [-1, 1] or raw int16 PCM.
+        """
+        if audio_array.dtype == np.int16:
+            # Fused scale and cast in a single pass
+            audio_array = np.multiply(audio_array, PCM16_SCALE, dtype=np.float32)
+
+        # Resample if needed (Whisper expects 16kHz)
+        if sample_rate != WHISPER_RATE:
+            g = gcd(WHISPER_RATE, sample_rate)
+            audio_array = resample_poly(
+                audio_array, WHISPER_RATE // g, sample_rate // g
+            )
+        # No copy when the samples are already float32
+        audio_array = np.asarray(audio_array, dtype=np.float32)
+
+        segments, info = self.model.transcribe(
+            audio_array,
+            language=self.force_language,
+            beam_size=1,
+            vad_filter=False,
+        )
+        if not self.force_language:
+            logger.info(f"Detected language: {info.language}")
+            if info.language not in ("en", "ja"):
+                logger.warning(f"Unsupported language: {info.language}")
+                return None
+
+        # Segments are generated lazily, so decoding happens here
+        return " ".join(segment.text.strip() for segment in segments)
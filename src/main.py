@@ -18,7 +18,7 @@ from agent.mcpclient import McpClientManager
 from config import Config
 from input.audio import RATE, AudioInput
 from input.text import TextInput
-from input.transcribe import Transcriber, TranscriberLike
+from input.transcribe import FasterWhisperTranscriber, Transcriber, TranscriberLike
 from logging_config import setup_logging
 from model.event import EventData
 from model.pipeline import PipelineController
@@ -59,11 +59,11 @@ def generate_thread_id() -> str:
 async def run_pipeline_cycle(
     chat_agent: ChatAgentLike,
     voice: Voice,
+    transcriber: Optional[TranscriberLike],
     config: Config,
     pa: pyaudio.PyAudio,
     audio_lock: asyncio.Lock,
     input_type: str,
-    lang: str,
     debug: bool,
 ) -> None:
     """
@@ -76,7 +76,6 @@ async def run_pipeline_cycle(
 
     # Create the appropriate input handler first
     input_handler: Optional[InputLike] = None
-    transcriber: Optional[TranscriberLike] = None
 
     # Create events for the input handlers
     audio_event = EventData()
@@ -84,7 +83,6 @@ async def run_pipeline_cycle(
 
     if input_type == INPUT.VOICE.value:
         input_handler = AudioInput(pa, audio_event, audio_lock, debug=debug)
-        transcriber = Transcriber(model_name=config.whisper_model, force_language=lang)
     elif input_type == INPUT.TEXT.value:
         input_handler = TextInput(input_event)
     else:
@@ -93,64 +91,93 @@ async def run_pipeline_cycle(
     if input_handler is None:
         raise ValueError("Input handler is not initialized.")
 
-    # First create the TaskGroup to manage tasks
-    async with asyncio.TaskGroup() as tg:
-        # Start the input worker to get input
-        if input_type == INPUT.VOICE.value and transcriber is not None:
-            # Start the input worker for voice input
-            tg.create_task(
-                input_worker(input_handler, config, is_voice_input=True),
-                name="input_worker_initial",
-            )
-
-            # Wait for audio input to be received
-            audio_data = await audio_event.get()
-
-            # Now create the PipelineController with the audio data
-            async with PipelineController(audio_data=audio_data) as ctlr:
-                # Create the transcribe worker to process the audio
+    # The TaskGroup supervises the workers: the first failure cancels the
+    # rest, and ends only this cycle
+    try:
+        async with asyncio.TaskGroup() as tg:
+            # Start the input worker to get input
+            if input_type == INPUT.VOICE.value and transcriber is not None:
+                # Start the input worker for voice input
                 tg.create_task(
-                    transcribe_worker(ctlr, transcriber, RATE),
-                    name="transcribe_worker",
+                    input_worker(input_handler, config, is_voice_input=True),
+                    name="input_worker_initial",
                 )
 
-                # Create chat and speech worker tasks
+                # Wait for audio input to be received
+                audio_data = await audio_event.get()
+
+                # Now create the PipelineController with the audio data
+                async with PipelineController(audio_data=audio_data) as ctlr:
+                    workers = [
+                        # Create the transcribe worker to process the audio
+                        tg.create_task(
+                            transcribe_worker(ctlr, transcriber, RATE),
+                            name="transcribe_worker",
+                        ),
+                        # Create chat and speech worker tasks
+                        tg.create_task(
+                            chat_worker(ctlr, chat_agent),
+                            name="chat_worker",
+                        ),
+                        tg.create_task(
+                            speech_worker(ctlr, voice),
+                            name="speech_worker",
+                        ),
+                    ]
+
+                    # Wait for pipeline completion or cancellation
+                    await ctlr.wait_terminal()
+                    _cancel_unfinished(workers)
+
+            elif input_type == INPUT.TEXT.value:
+                # Start the input worker for text input
                 tg.create_task(
-                    chat_worker(ctlr, chat_agent),
-                    name="chat_worker",
+                    input_worker(input_handler, config, is_voice_input=False),
+                    name="input_worker_initial",
                 )
-                tg.create_task(
-                    speech_worker(ctlr, voice),
-                    name="speech_worker",
-                )
-
-                # Wait for pipeline completion
-                await ctlr.wait_for_completion()
 
-        elif input_type == INPUT.TEXT.value:
-            # Start the input worker for text input
-            tg.create_task(
-                input_worker(input_handler, config, is_voice_input=False),
-                name="input_worker_initial",
+                # Wait for text input to be received
+                text_input = await input_event.get()
+
+                # Now create the PipelineController with the text input
+                async with PipelineController(text_input=text_input) as ctlr:
+                    # Create chat and speech worker tasks
+                    workers = [
+                        tg.create_task(
+                            chat_worker(ctlr, chat_agent),
+                            name="chat_worker",
+                        ),
+                        tg.create_task(
+                            speech_worker(ctlr, voice),
+                            name="speech_worker",
+                        ),
+                    ]
+
+                    # Wait for pipeline completion or cancellation
+                    await ctlr.wait_terminal()
+                    _cancel_unfinished(workers)
+
+    except* EOFError:
+        # Closed stdin ends the application, not just this cycle
+        raise
+    except* Exception as eg:
+        for e in eg.exceptions:
+            logger.error(
+                f"Pipeline worker error: {e}\n{''.join(traceback.format_exception(e))}"
             )
 
-            # Wait for text input to be received
-            text_input = await input_event.get()
 
-            # Now create the PipelineController with the text input
-            async with PipelineController(text_input=text_input) as ctlr:
-                # Create chat and speech worker tasks
-                tg.create_task(
-                    chat_worker(ctlr, chat_agent),
-                    name="chat_worker",
-                )
-                tg.create_task(
-                    speech_worker(ctlr, voice),
-                    name="speech_worker",
-                )
+def _cancel_unfinished(workers: list[asyncio.Task]) -> None:
+    """
+    Cancel workers that are still running once the pipeline is terminal.
 
-                # Wait for pipeline completion
-                await ctlr.wait_for_completion()
+    A worker can be left waiting for input that will never come, such as the
+    chat worker after a transcript is rejected, and the TaskGroup would wait
+    for it forever.
+    """
+    for worker in workers:
+        if not worker.done():
+            worker.cancel()
 
 
 async def main() -> None:
@@ -212,17 +239,22 @@ async def main() -> None:
     # Create the voice handler
     voice = make_voice(args.output, pa, audio_lock, args.lang, args.debug)
 
+    # Load the speech recognition model once and reuse it across cycles
+    transcriber: Optional[TranscriberLike] = None
+    if args.input == INPUT.VOICE.value:
+        transcriber = make_transcriber(config, args.lang)
+
     try:
         # Run pipeline cycles continuously
         while True:
             await run_pipeline_cycle(
                 chat_agent,
                 voice,
+                transcriber,
                 config,
                 pa,
                 audio_lock,
                 args.input,
-                args.lang,
                 args.debug,
             )
     except* (asyncio.CancelledError, EOFError, KeyboardInterrupt) as term_errors:
@@ -241,6 +273,7 @@ async def main() -> None:
         traceback.print_exc()
     finally:
         logger.info("Stopped.")
+        voice.close()
         pa.terminate()
 
         if mcp_client_manager:
@@ -255,6 +288,15 @@ def make_voice(output: OUTPUT, pa, audio_lock, lang: str, debug: bool) -> Voice:
     return TextVoice()
 
 
+def make_transcriber(config: Config, lang: str) -> TranscriberLike:
+    if config.whisper_backend == "faster":
+        return FasterWhisperTranscriber(
+            model_name=config.whisper_model, force_language=lang
+        )
+
+    return Transcriber(model_name=config.whisper_model, force_language=lang)
+
+
 def make_chat_agent(
     config: Config,
     lang: str,
@@ -3,13 +3,50 @@ import logging
 import traceback
 from asyncio import Event
 from types import TracebackType
-from typing import Any, Optional, Self, Type
+from typing import Any, Callable, Generic, Optional, Self, Type, TypeVar
 
 from model.event import EventData
 from model.queue_event import QueuedEventData
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+SPEECH_QUEUE_MAXSIZE = 8  # Backpressure on the chat worker when speech falls behind
+
+
+class _LazySlot(Generic[T]):
+    """
+    Create a value on first access and store it in a backing slot.
+
+    The factory is called with the owning instance.
+
+    The backing slot is named after the attribute with a trailing underscore
+    and must be listed in the owner's __slots__.
+    """
+
+    def __init__(self, factory: Callable[[Any], T]):
+        self._factory = factory
+
+    def __set_name__(self, owner: type, name: str):
+        self._slot = getattr(owner, f"{name}_")
+
+    def __get__(self, instance: Any, owner: type | None = None) -> T:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            value = self._factory(instance)
+            self._slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: Any, value: T):
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any):
+        self._slot.__delete__(instance)
+
 
 class PipelineController:
     """
@@ -41,34 +78,75 @@ class PipelineController:
         _speech_queue (QueuedEventData): Queues text responses from chat to speech output,
                                       allowing for multiple responses to be processed in sequence.
         _completed (Event): Signal that the pipeline has completed processing.
+        is_cancellation_requested (Callable[[], bool]): Bound ``is_set`` of ``_cancel_requested``.
+        is_completed (Callable[[], bool]): Bound ``is_set`` of ``_completed``.
     """
 
-    def __init__(self, *, audio_data: Any = None, text_input: str | None = None):
+    __slots__ = (
+        "_cancel_requested",
+        "_completed",
+        "_audio_event_",
+        "_input_event_",
+        "_speech_queue_",
+        "_initial_audio_data",
+        "_initial_text_input",
+        "_speech_queue_maxsize",
+        "is_cancellation_requested",
+        "is_completed",
+    )
+
+    # Created lazily on first access since not every run uses all of them
+    _audio_event = _LazySlot(lambda ctlr: EventData())
+    _input_event = _LazySlot(lambda ctlr: EventData())
+    # Using QueuedEventData for sequential processing
+    _speech_queue = _LazySlot(
+        lambda ctlr: QueuedEventData(maxsize=ctlr._speech_queue_maxsize)
+    )
+
+    def __init__(
+        self,
+        *,
+        audio_data: Any = None,
+        text_input: str | None = None,
+        speech_queue_maxsize: int = SPEECH_QUEUE_MAXSIZE,
+    ):
         """
         Initialize a new PipelineController with the specified input data.
 
         Args:
             audio_data: Audio data for voice input (mutually exclusive with text_input)
             text_input: Text input for text input (mutually exclusive with audio_data)
+            speech_queue_maxsize: Maximum number of pending speech items before the
+                                  chat worker is blocked. 0 means unlimited.
         """
         if audio_data is None and text_input is None:
             raise ValueError("Either audio_data or text_input must be provided")
         if audio_data is not None and text_input is not None:
             raise ValueError("Only one of audio_data or text_input can be provided")
 
-        # Private event and queue attributes
+        # Private event and queue attributes.
+        # _audio_event, _input_event and _speech_queue are created lazily on
+        # first access since not every run uses all of them.
         self._cancel_requested = Event()
-        self._audio_event = EventData()
-        self._input_event = EventData()
-        self._speech_queue = (
-            QueuedEventData()
-        )  # Using QueuedEventData for sequential processing
         self._completed = Event()  # New event to signal pipeline completion
 
+        # Workers poll these on every loop iteration, so bind the Event.is_set
+        # methods directly instead of going through a wrapper method.
+        self.is_cancellation_requested: Callable[[], bool] = (
+            self._cancel_requested.is_set
+        )
+        self.is_completed: Callable[[], bool] = self._completed.is_set
+
+        self._speech_queue_maxsize = speech_queue_maxsize
+
         # Store the initial input data for later use
         self._initial_audio_data = audio_data
         self._initial_text_input = text_input
 
+    def _materialized(self, name: str) -> bool:
+        """Check whether a lazily created primitive has been accessed yet."""
+        return hasattr(self, f"{name}_")
+
     async def __aenter__(self) -> Self:
         """Enter the async context manager."""
         # Set the initial input data now that we have an event loop
@@ -101,12 +179,15 @@ class PipelineController:
         """Request cancellation of the pipeline processing."""
         self._cancel_requested.set()
         # 待機中のタスクを解放するためにイベントをセット
-        # Set events to allow waiting tasks to exit
-        asyncio.create_task(self._audio_event.set(None))
-        asyncio.create_task(self._input_event.set(None))
-        asyncio.create_task(
-            self._speech_queue.put(None)
-        )  # Using put for QueuedEventData
+        # Set events to allow waiting tasks to exit.
+        # Nobody can be waiting on a primitive that was never created.
+        if self._materialized("_audio_event"):
+            asyncio.create_task(self._audio_event.set(None))
+        if self._materialized("_input_event"):
+            asyncio.create_task(self._input_event.set(None))
+        if self._materialized("_speech_queue"):
+            # Wakes blocked producers and consumers directly and drops chat output
+            self._speech_queue.close()
 
     async def cleanup(self):
         """
@@ -117,10 +198,14 @@ class PipelineController:
         """
 
         try:
-            # Reset events to prevent hanging
-            self._speech_queue.reset()
-            self._input_event.reset()
-            self._audio_event.reset()
+            # Reset events to prevent hanging. The speech queue is closed, not
+            # reopened, since workers may still be blocked on it.
+            if self._materialized("_speech_queue"):
+                self._speech_queue.close()
+            if self._materialized("_input_event"):
+                self._input_event.reset()
+            if self._materialized("_audio_event"):
+                self._audio_event.reset()
 
             # Signal completion if not already done
             if not self._completed.is_set():
@@ -131,29 +216,31 @@ class PipelineController:
                 logger.error(f"Error during cleanup: {exc}\n{traceback.format_exc()}")
             # Continue with shutdown even if cleanup fails
 
-    def is_cancellation_requested(self) -> bool:
+    async def wait_for_completion(self):
         """
-        Check if cancellation of the pipeline has been requested.
-
-        Returns:
-            bool: True if cancellation has been requested, False otherwise.
+        Wait until the pipeline has completed processing.
         """
-        return self._cancel_requested.is_set()
+        await self._completed.wait()
 
-    def is_completed(self) -> bool:
+    async def wait_for_cancellation(self):
         """
-        Check if the pipeline has completed processing.
-
-        Returns:
-            bool: True if the pipeline has completed, False otherwise.
+        Wait until cancellation of the pipeline has been requested.
         """
-        return self._completed.is_set()
+        await self._cancel_requested.wait()
 
-    async def wait_for_completion(self):
+    async def wait_terminal(self):
         """
-        Wait until the pipeline has completed processing.
+        Wait until the pipeline has either completed or been asked to cancel.
         """
-        await self._completed.wait()
+        waiters = [
+            asyncio.create_task(self._completed.wait()),
+            asyncio.create_task(self._cancel_requested.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
 
     # Accessor methods for events and queues
     async def set_audio_data(self, data: Any):
@@ -172,8 +259,8 @@ class PipelineController:
         """Wait for input text to be ready and return it."""
         return await self._input_event.get()
 
-    async def add_to_speech_queue(self, text: str):
-        """Add text to the speech queue for processing."""
+    async def add_to_speech_queue(self, text: Any):
+        """Add text, or an end-of-batch marker, to the speech queue for processing."""
         await self._speech_queue.put(text)
 
     async def get_from_speech_queue(self) -> Any:
@@ -183,15 +270,3 @@ class PipelineController:
     def speech_queue_task_done(self):
         """Mark a speech queue item as done."""
         self._speech_queue.task_done()
-
-    async def mark_speech_batch_complete(self):
-        """Signal that a batch of speech items is complete."""
-        await self._speech_queue.mark_batch_complete()
-
-    async def speech_batch_is_complete(self) -> bool:
-        """Check if the current speech batch is marked as complete."""
-        return self._speech_queue.is_batch_complete()
-
-    # async def wait_for_speech_batch_completion(self):
-    #     """Wait until the current speech batch is marked as complete."""
-    #     await self._speech_queue.wait_for_batch_completion()
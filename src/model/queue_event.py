@@ -4,6 +4,16 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Text chunks merged into one queue slot before a new slot is needed
+MAX_COALESCED_CHUNKS = 8
+
+
+class _CoalescedText(list[str]):
+    """Text chunks merged into a single queue slot, joined on retrieval."""
+
+    def join(self) -> str:
+        return "\n".join(self)
+
 
 class QueuedEventData:
     """
@@ -13,6 +23,13 @@ class QueuedEventData:
     from one task to another, such as streamed responses from an AI model.
     """
 
+    __slots__ = (
+        "_queue",
+        "_closed",
+        "_last_item",
+        "_waiting_getters",
+    )
+
     def __init__(self, maxsize: int = 0):
         """
         Initialize with an optional maximum queue size.
@@ -22,12 +39,20 @@ class QueuedEventData:
         """
         self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
         self._closed: bool = False
-        self._batch_complete: asyncio.Event = asyncio.Event()
+        # Text slot still waiting in the queue that new text can be merged into
+        self._last_item: Optional[_CoalescedText] = None
+        # Consumers currently blocked in get(), so close() can wake them
+        self._waiting_getters: int = 0
 
     async def put(self, data: Any):
         """
         Add data to the queue for processing.
 
+        Consecutive strings are coalesced into the pending text item while it
+        has not been consumed yet, so the consumer handles them in one call.
+        Each item holds at most MAX_COALESCED_CHUNKS chunks, so a bounded
+        queue still applies backpressure to a fast producer.
+
         Args:
             data: The data to add to the queue.
         """
@@ -35,34 +60,53 @@ class QueuedEventData:
             logger.warning("Attempt to put data into a closed queue")
             return
 
-        await self._queue.put(data)
+        if not isinstance(data, str):
+            self._last_item = None
+            await self._put(data)
+            return
 
-    async def mark_batch_complete(self):
-        """
-        Signal that a batch of related items is complete.
-        This allows consumers to know when a logical group of items is fully processed.
-        """
-        self._batch_complete.set()
+        last_item = self._last_item
+        if last_item is not None and len(last_item) < MAX_COALESCED_CHUNKS:
+            last_item.append(data)
+            return
+
+        item = _CoalescedText([data])
+        if await self._put(item):
+            self._last_item = item
 
-    async def wait_for_batch_completion(self):
+    async def _put(self, item: Any) -> bool:
         """
-        Wait until the current batch is marked as complete.
+        Put an item, waiting for room in a bounded queue.
+
+        Returns:
+            False if the queue was closed while waiting and the item was dropped.
         """
-        await self._batch_complete.wait()
-        self._batch_complete.clear()  # Reset for the next batch
+        await self._queue.put(item)
+        if self._closed:
+            # close() discarded the backlog to wake us; pass that on to the
+            # next blocked producer along with our own item
+            self._discard_backlog()
+            return False
+        return True
 
     async def get(self) -> Any:
         """
         Wait for and retrieve the next item from the queue.
 
         Returns:
-            The next item from the queue.
+            The next item from the queue, or None once the queue is closed
+            and drained.
         """
-        if self._closed and self._queue.empty():
-            logger.warning("Attempt to get data from an empty closed queue")
+        if self._closed:
+            logger.warning("Attempt to get data from a closed queue")
             return None
 
-        return await self._queue.get()
+        self._waiting_getters += 1
+        try:
+            item = await self._queue.get()
+        finally:
+            self._waiting_getters -= 1
+        return self._unwrap(item)
 
     def get_nowait(self) -> Optional[Any]:
         """
@@ -72,10 +116,18 @@ class QueuedEventData:
             The next item from the queue or None if queue is empty.
         """
         try:
-            return self._queue.get_nowait()
+            return self._unwrap(self._queue.get_nowait())
         except asyncio.QueueEmpty:
             return None
 
+    def _unwrap(self, item: Any) -> Any:
+        """Join coalesced text and stop merging into it once it is dequeued."""
+        if type(item) is not _CoalescedText:
+            return item
+        if item is self._last_item:
+            self._last_item = None
+        return item.join()
+
     def task_done(self):
         """Mark a queue item as done, required for join()."""
         self._queue.task_done()
@@ -83,30 +135,45 @@ class QueuedEventData:
     def close(self):
         """
         Mark the queue as closed. No more items should be added.
-        Existing items can still be retrieved.
+        Pending items are discarded.
+
+        Producers blocked in put() are woken and their items dropped.
+        Consumers blocked in get() are woken with None as end-of-stream.
         """
         self._closed = True
+        self._last_item = None
+        self._discard_backlog()
+        self._release_getters()
 
-    def reset(self):
-        """
-        Reset the queue, removing all pending items.
-        This reopens the queue for new items if it was closed.
-        """
-        while not self._queue.empty():
+    def _discard_backlog(self):
+        """Drop every pending item, which wakes producers blocked on a full queue."""
+        while True:
             try:
                 self._queue.get_nowait()
-                self._queue.task_done()
             except asyncio.QueueEmpty:
                 break
+            self._queue.task_done()
 
-        self._closed = False
-        self._batch_complete.clear()  # Make sure the batch completion event is cleared
+    def _release_getters(self):
+        """Hand every consumer blocked in get() a None end-of-stream marker."""
+        for _ in range(self._waiting_getters):
+            try:
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # Items are available, so nobody stays blocked
+                break
 
-    def is_batch_complete(self) -> bool:
+    def reset(self):
         """
-        Check if the current batch has been marked as complete.
-
-        Returns:
-            True if the batch is complete, False otherwise.
+        Reset the queue, removing all pending items.
+        This reopens the queue for new items if it was closed.
         """
-        return self._batch_complete.is_set()
+        # Wake producers and consumers blocked on the old queue before it is dropped
+        self._discard_backlog()
+        self._release_getters()
+
+        # Swapping in a fresh queue is O(1), unlike draining item by item.
+        self._queue = asyncio.Queue(maxsize=self._queue.maxsize)
+
+        self._closed = False
+        self._last_item = None
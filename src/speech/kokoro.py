@@ -1,11 +1,21 @@
+import asyncio
 import logging
-from typing import Protocol
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Protocol
 
+import numpy as np
+import torch
 from kokoro import KPipeline
 
-SPEECH_FORMAT_WIDTH = 4
+SPEECH_FORMAT_WIDTH = 2  # int16 PCM
 SPEECH_CHANNELS = 1
 SPEECH_RATE = 24000
+SYNTHESIS_QUEUE_SIZE = 2  # Chunks synthesized ahead of playback
+INT16_PEAK = 32767  # Kokoro emits float32 samples in [-1, 1]
+SPLIT_PATTERN = re.compile(r"\n+")  # re.split accepts a compiled pattern
 
 # 🇺🇸 'a' => American English, 🇬🇧 'b' => British English
 # 🇯🇵 'j' => Japanese: pip install misaki[ja]
@@ -23,6 +33,20 @@ logger = logging.getLogger(__name__)
 class Voice(Protocol):
     def say(self, text): ...
 
+    def synthesize(self, text) -> Any: ...
+
+    def play(self, audio): ...
+
+    def close(self): ...
+
+
+@dataclass
+class _Utterance:
+    """Playback state of a single synthesized text."""
+
+    done: asyncio.Future
+    stop: threading.Event = field(default_factory=threading.Event)
+
 
 class KokoroVoice:
     def __init__(self, pa, audio_lock, lang="en", debug=False):
@@ -30,36 +54,199 @@ class KokoroVoice:
         lang_code = language_voice_map[lang]
         self.pipeline = KPipeline(lang_code=lang_code, repo_id="hexgrad/Kokoro-82M")
         self.voice = voice_name_map[lang_code]
+        # Resolve the voice pack once; KPipeline passes CPU float tensors through
+        self._voice_pack = self.pipeline.load_voice(self.voice)
         self.audio_lock = audio_lock
         self.pa = pa
+        # Open the output stream once and only start/stop it around playback
+        self._stream = self.pa.open(
+            format=self.pa.get_format_from_width(SPEECH_FORMAT_WIDTH, unsigned=False),
+            channels=SPEECH_CHANNELS,
+            rate=SPEECH_RATE,
+            output=True,
+            start=False,
+        )
+        # A single worker keeps all model calls on the same thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro")
+        # Blocking stream calls run on their own thread so playback does not
+        # freeze the event loop while a chunk is being written
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="kokoro-playback"
+        )
+        # Reusable PCM buffers, one per chunk that can be queued or playing.
+        # The float32 work buffer is only touched on the synthesis thread.
+        self._pcm_buffers = [
+            np.empty(SPEECH_RATE, dtype=np.int16)
+            for _ in range(SYNTHESIS_QUEUE_SIZE + 1)
+        ]
+        self._work_buffer = np.empty(SPEECH_RATE, dtype=np.float32)
+        self._next_buffer = 0
+        # Bounds how far synthesis may run ahead of playback
+        self._slots = threading.Semaphore(SYNTHESIS_QUEUE_SIZE)
+        # Chunks from every say() call, played in order by a single writer
+        self._playback_queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._playback_task: asyncio.Task | None = None
         logger.info(f"LangCode: {lang_code}, Voice: {self.voice}")
 
     async def say(self, text):
-        async with self.audio_lock:
+        await self.play(await self.synthesize(text))
+
+    async def synthesize(self, text) -> _Utterance:
+        """
+        Synthesize text in the background, queueing chunks for playback as they
+        are ready. Returns a handle to pass to play().
+        """
+        loop = asyncio.get_running_loop()
+        if self._playback_task is None or self._playback_task.done():
+            self._playback_task = asyncio.create_task(
+                self._playback_worker(), name="kokoro_playback"
+            )
+
+        utterance = _Utterance(done=loop.create_future())
+        try:
+            await loop.run_in_executor(
+                self._executor, self._synthesize, text, utterance, loop
+            )
+        except asyncio.CancelledError:
+            utterance.stop.set()
+            raise
+        except Exception as e:
+            # Whatever was synthesized before the error is still played
+            logger.error(f"Error while synthesizing audio: {e}")
+        return utterance
+
+    async def play(self, utterance: _Utterance):
+        """Wait until a synthesized utterance has been played."""
+        try:
+            await utterance.done
+        finally:
+            # Drop anything still queued if we were cancelled
+            utterance.stop.set()
+
+    def _synthesize(
+        self,
+        text: str,
+        utterance: _Utterance,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        """Run the Kokoro generator on the worker thread and queue chunks for playback."""
+        try:
             generator = self.pipeline(
                 text,
-                voice=self.voice,
+                voice=self._voice_pack,
                 speed=1.1,
-                split_pattern=r"\n+",
+                split_pattern=SPLIT_PATTERN,
             )
+            for i, (gs, ps, audio) in enumerate(generator):
+                # Wait for playback to catch up, giving up if the utterance is dropped
+                while not self._slots.acquire(timeout=0.1):
+                    if utterance.stop.is_set():
+                        return
+                if utterance.stop.is_set():
+                    self._slots.release()
+                    return
+                # A free slot guarantees the oldest PCM buffer is no longer in use
+                pcm = self._to_pcm16(audio, self._next_buffer)
+                self._next_buffer = (self._next_buffer + 1) % len(self._pcm_buffers)
+                loop.call_soon_threadsafe(
+                    self._playback_queue.put_nowait, (utterance, (i, gs, ps, pcm))
+                )
+        finally:
+            if not utterance.stop.is_set():
+                # End-of-utterance marker, also after a synthesis error
+                loop.call_soon_threadsafe(
+                    self._playback_queue.put_nowait, (utterance, None)
+                )
 
+    async def _playback_worker(self):
+        """Write queued chunks to the output stream, one utterance after another."""
+        while True:
+            utterance, chunk = await self._playback_queue.get()
             try:
-                stream = self.pa.open(
-                    format=self.pa.get_format_from_width(
-                        SPEECH_FORMAT_WIDTH, unsigned=False
-                    ),
-                    channels=SPEECH_CHANNELS,
-                    rate=SPEECH_RATE,
-                    output=True,
-                )
+                if chunk is None:
+                    if not utterance.done.done():
+                        utterance.done.set_result(None)
+                else:
+                    self._slots.release()
+                    if not utterance.stop.is_set():
+                        await self._play(*chunk)
 
-                for i, (gs, ps, audio) in enumerate(generator):
-                    logger.info(f"{i}: {gs}")  # i => index, gs => graphemes/text
-                    if self.debug:
-                        logger.debug(ps)  # ps => phonemes
-                    stream.write(audio.numpy().tobytes())
+                # Stop between utterances, not while synthesis is catching up
+                finished = chunk is None or utterance.stop.is_set()
+                if finished and self._playback_queue.empty():
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._writer, self._stop_stream
+                    )
             except Exception as e:
-                logger.error(f"Error while playing audio: {e}")
-            finally:
-                stream.stop_stream()
-                stream.close()
+                # Keep the worker alive for later utterances, and drop the rest
+                # of this one so its play() call does not wait forever
+                logger.error(f"Error in playback worker: {e}")
+                utterance.stop.set()
+                if not utterance.done.done():
+                    utterance.done.set_result(None)
+
+    async def _play(self, i: int, gs: str, ps: str, pcm: np.ndarray):
+        logger.info(f"{i}: {gs}")  # i => index, gs => graphemes/text
+        if self.debug:
+            logger.debug(ps)  # ps => phonemes
+        loop = asyncio.get_running_loop()
+        try:
+            # Only the write itself needs to exclude microphone reads
+            async with self.audio_lock:
+                await loop.run_in_executor(self._writer, self._write, pcm)
+        except Exception as e:
+            logger.error(f"Error while playing audio: {e}")
+
+    def _write(self, pcm: np.ndarray):
+        """Write a chunk to the output stream on the writer thread, blocking until queued."""
+        if self._stream.is_stopped():
+            self._stream.start_stream()
+        self._stream.write(_pcm_buffer(pcm))
+
+    def _stop_stream(self):
+        """Stop the output stream on the writer thread once it has drained."""
+        if self._stream.is_active():
+            self._stream.stop_stream()
+
+    def _to_pcm16(self, audio: torch.Tensor, index: int) -> np.ndarray:
+        """
+        Quantize Kokoro float32 audio to int16 PCM in a reusable buffer.
+        Args:
+        audio (torch.Tensor): float32 samples in [-1, 1]
+        index (int): PCM buffer to write into
+        Returns:
+        np.ndarray: View of the int16 samples
+        """
+        n = audio.shape[-1]
+        if len(self._work_buffer) < n:
+            self._work_buffer = np.empty(n, dtype=np.float32)
+        if len(self._pcm_buffers[index]) < n:
+            self._pcm_buffers[index] = np.empty(n, dtype=np.int16)
+
+        work = torch.from_numpy(self._work_buffer[:n])
+        pcm = self._pcm_buffers[index][:n]
+        torch.clamp(audio.detach().cpu().reshape(-1), -1.0, 1.0, out=work)
+        work.mul_(INT16_PEAK)
+        torch.from_numpy(pcm).copy_(work)
+        return pcm
+
+    def close(self):
+        """Close the output stream. The PyAudio instance is owned by the caller."""
+        if self._playback_task is not None:
+            self._playback_task.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True, cancel_futures=True)
+        self._stream.close()
+
+
+def _pcm_buffer(pcm: np.ndarray) -> memoryview:
+    """
+    Expose PCM samples as raw bytes without copying.
+    Args:
+    pcm (np.ndarray): int16 samples
+    Returns:
+    memoryview: Byte view over the sample memory
+    """
+    # PyAudio only accepts read-only buffers besides bytes
+    pcm.flags.writeable = False
+    return memoryview(pcm).cast("B")
@@ -1,23 +1,32 @@
-import asyncio
+import io
 import logging
+import os
+import sys
 
 logger = logging.getLogger(__name__)
 
 
 class TextVoice:
     async def say(self, text):
-        pending_texts = [text]
-        while pending_texts:
-            text = pending_texts.pop(0)
-            try:
-                print(f"TextVoice: {text}", flush=True)
-                await asyncio.sleep(0.1)
-            except BlockingIOError:
-                # If the output is blocked, we can just wait and retry
-                pending_texts.append(text)
-                logger.warning(
-                    "TextVoice output is blocked, retrying after a short delay."
-                )
-            except Exception as e:
-                print(f"Error in TextVoice: {e}", flush=True)
-                break
+        await self.play(await self.synthesize(text))
+
+    async def synthesize(self, text) -> str:
+        return text
+
+    async def play(self, text):
+        # aioconsole makes the shared tty non-blocking when it reads input,
+        # so restore blocking mode rather than retrying partial writes
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            fd = None  # No file descriptor, e.g. a StringIO or captured stream
+        try:
+            if fd is not None and not os.get_blocking(fd):
+                os.set_blocking(fd, True)
+            sys.stdout.write(f"TextVoice: {text}\n")
+            sys.stdout.flush()
+        except Exception as e:
+            logger.error(f"Error in TextVoice: {e}")
+
+    def close(self):
+        pass
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import random
+import re
 import traceback
 
 from input.transcribe import TranscriberLike
@@ -9,6 +11,19 @@ from speech.kokoro import Voice
 
 logger = logging.getLogger(__name__)
 
+# Queued by the chat worker after its last response to end the speech batch
+SENTINEL = object()
+
+# Speech items that may be synthesizing or waiting to play at once
+SPEECH_LOOKAHEAD = 3
+
+# Retry delays for a failing input device, doubled up to the cap
+INPUT_RETRY_BACKOFF = 0.1
+INPUT_RETRY_BACKOFF_MAX = 5.0
+
+# Any alphanumeric character (word characters minus underscore)
+_ALNUM_RE = re.compile(r"[^\W_]")
+
 
 async def input_worker(
     input_handler, config=None, is_voice_input=True, wait_event=None
@@ -16,7 +31,9 @@ async def input_worker(
     """
     Worker task for receiving input (either voice or text).
 
-    This function simply receives input once and returns.
+    This function receives input once and returns. Attempts that fail with
+    a transient I/O error (OSError) are retried with exponential backoff and
+    jitter. Other errors, such as EOFError when stdin closes, propagate.
 
     Args:
         input_handler: The input handler to use (AudioInput or TextInput)
@@ -24,24 +41,28 @@ async def input_worker(
         is_voice_input: Whether this is voice input (True) or text input (False)
         wait_event: Event to wait for before receiving input (optional)
     """
-    try:
-        # Attempt to receive input based on the configuration
-        if is_voice_input and config:
-            await input_handler.receive(
-                silence_duration=config.silence_duration,
-                min_speech_duration=config.min_speech_duration,
-                silence_threshold=config.silence_threshold,
-            )
-        else:
-            await input_handler.receive()
+    backoff = INPUT_RETRY_BACKOFF
+    while True:
+        try:
+            # Attempt to receive input based on the configuration
+            if is_voice_input and config:
+                await input_handler.receive(
+                    silence_duration=config.silence_duration,
+                    min_speech_duration=config.min_speech_duration,
+                    silence_threshold=config.silence_threshold,
+                )
+            else:
+                await input_handler.receive()
+            return
 
-    except* asyncio.CancelledError as cancel_exc:
-        # Handle cancellation specifically
-        for exc in cancel_exc.exceptions:
-            logger.info(f"Input worker cancelled: {exc}")
-        raise  # Re-raise to propagate cancellation
-    except* Exception as e:
-        logger.error(f"Input worker error: {e}\n{traceback.format_exc()}")
+        except asyncio.CancelledError:
+            logger.info("Input worker cancelled")
+            raise  # Re-raise so the task ends up cancelled
+        except OSError as e:
+            logger.error(f"Input worker error: {e}\n{traceback.format_exc()}")
+            # Jittered backoff so a broken device neither spins nor floods logs
+            await asyncio.sleep(backoff + random.uniform(0, backoff * 0.1))
+            backoff = min(backoff * 2, INPUT_RETRY_BACKOFF_MAX)
 
 
 async def transcribe_worker(
@@ -50,31 +71,22 @@ async def transcribe_worker(
     sample_rate: int,
 ):
     """Worker task for transcribing audio input to text for a single pipeline run."""
-    try:
-        audio_array = await ctlr.get_audio_data()
-        logger.info("* Transcribing...")
+    audio_array = await ctlr.get_audio_data()
+    logger.info("* Transcribing...")
 
-        result = transcriber.transcribe_buffer(audio_array, sample_rate)
+    result = transcriber.transcribe_buffer(audio_array, sample_rate)
 
-        # Skip if result doesn't contain valid word
-        if result is None or not any(char.isalnum() for char in result):
-            logger.warning(f"{result} does not contain valid word.")
-            # Signal completion since we're not continuing with this input
-            ctlr.complete()
-            return
-
-        # Print the recognized text
-        logger.info(f"Transcript: {result}")
-        if result:
-            await ctlr.set_input_text(result)
+    # Skip if result doesn't contain valid word
+    if result is None or _ALNUM_RE.search(result) is None:
+        logger.warning(f"{result} does not contain valid word.")
+        # Signal completion since we're not continuing with this input
+        ctlr.complete()
+        return
 
-    except* asyncio.CancelledError as cancel_exc:
-        # Handle cancellation specifically
-        for exc in cancel_exc.exceptions:
-            logger.info(f"Transcribe worker cancelled: {exc}")
-        raise  # Re-raise to propagate cancellation
-    except* Exception as e:
-        logger.error(f"Transcribe worker error: {e}\n{traceback.format_exc()}")
+    # Print the recognized text
+    logger.info(f"Transcript: {result}")
+    if result:
+        await ctlr.set_input_text(result)
 
 
 async def chat_worker(
@@ -82,95 +94,102 @@ async def chat_worker(
     chat_agent: ChatAgentLike,
 ):
     """Worker task for processing chat interactions for a single pipeline run."""
+    message = await ctlr.get_input_text()
+    logger.info("* Chatting...")
+
     try:
-        message = await ctlr.get_input_text()
-        logger.info("* Chatting...")
-        response_received = False
+        # Process chat responses
+        async for response in chat_agent.chat(message):
+            await ctlr.add_to_speech_queue(response)
+        logger.info("Chat response complete")
+    except asyncio.CancelledError:
+        logger.info("Chat response generation cancelled")
+        raise  # Re-raise so the task ends up cancelled
+    except Exception as e:
+        logger.error(f"Chat Error: {e}\n{traceback.format_exc()}")
 
-        try:
-            # Process chat responses
-            async for response in chat_agent.chat(message):
-                await ctlr.add_to_speech_queue(response)
-                response_received = True
-
-            # Mark batch complete only if we got at least one response
-            if response_received:
-                logger.info("Chat response complete, marking batch as complete")
-                await ctlr.mark_speech_batch_complete()
-        except* asyncio.CancelledError:
-            logger.info("Chat response generation cancelled")
-            raise  # Re-raise to allow proper task cancellation
-        except* Exception as eg:
-            for e in eg.exceptions:
-                logger.error(f"Chat Error: {e}\n{traceback.format_exc()}")
-            # Even if we had an error, if we got any responses at all,
-            # we should mark the batch as complete
-            if response_received:
-                await ctlr.mark_speech_batch_complete()
-
-    except* asyncio.CancelledError as e:
-        logger.info(f"Chat worker cancelled: {e}")
-        raise  # Re-raise to propagate cancellation
-    except* Exception as e:
-        logger.error(f"Chat worker error: {e}\n{traceback.format_exc()}")
+    # Even with no responses or an error, let the speech worker finish
+    await ctlr.add_to_speech_queue(SENTINEL)
 
 
 async def speech_worker(ctlr: PipelineController, voice: Voice):
     """Worker task for processing speech output from the chat responses for a single pipeline run."""
-    try:
-        # Get the first speech item
-        speech = await ctlr.get_from_speech_queue()
-        ctlr.speech_queue_task_done()
+    lookahead = asyncio.Semaphore(SPEECH_LOOKAHEAD)
+    # The TaskGroup cancels outstanding synthesis and playback together
+    async with asyncio.TaskGroup() as tg:
+        # Synthesis and playback tasks that have not finished yet
+        outstanding: set[asyncio.Task] = set()
+        pending_play: asyncio.Task | None = None
+        while True:
+            # Take a look-ahead slot before dequeuing, so the worker only ever
+            # waits on the queue, where close() can wake it, while holding no item
+            if not await _acquire_unless_cancelled(ctlr, lookahead):
+                break
+            speech = await ctlr.get_from_speech_queue()
+            # None means the queue was closed by a cancellation request
+            if speech is SENTINEL or speech is None:
+                break
+            ctlr.speech_queue_task_done()
+            if ctlr.is_cancellation_requested():
+                break
+
+            # Synthesize ahead while earlier items are still playing
+            synthesis = tg.create_task(voice.synthesize(speech))
+            pending_play = tg.create_task(
+                _play_in_order(voice, synthesis, pending_play, lookahead)
+            )
+            for task in (synthesis, pending_play):
+                outstanding.add(task)
+                task.add_done_callback(outstanding.discard)
 
-        # Process the speech if it's not None
-        if speech is not None:
-            await voice.say(speech)
+        if ctlr.is_cancellation_requested():
+            # Stop speaking now instead of draining the look-ahead
+            for task in outstanding:
+                task.cancel()
 
-        # # Create a task to wait for batch completion
-        # batch_completion_task = asyncio.create_task(
-        #     ctlr.wait_for_speech_batch_completion()
-        # )
+    # Signal that the pipeline has completed
+    ctlr.complete()
 
-        try:
-            # Process all items until batch completion
-            while not await ctlr.speech_batch_is_complete():
-                try:
-                    # Try to get an item with a shorter timeout for faster response
-                    speech = await asyncio.wait_for(
-                        ctlr.get_from_speech_queue(), timeout=0.05
-                    )
-                    ctlr.speech_queue_task_done()
-
-                    if speech is not None:
-                        await voice.say(speech)
-                except asyncio.TimeoutError:
-                    # No items available, just continue checking batch status
-                    await asyncio.sleep(0.01)
-
-            # Process any remaining items in the queue after batch is complete
-            while True:
-                try:
-                    speech = await asyncio.wait_for(
-                        ctlr.get_from_speech_queue(), timeout=0.05
-                    )
-                    ctlr.speech_queue_task_done()
-
-                    if speech is not None:
-                        await voice.say(speech)
-                except asyncio.TimeoutError:
-                    break
-
-            # Signal that the pipeline has completed
-            ctlr.complete()
-        finally:
-            # Always ensure we clean up the task
-            if not await ctlr.speech_batch_is_complete():
-                await ctlr.mark_speech_batch_complete()
-
-    except* asyncio.CancelledError as cancel_exc:
-        # Handle worker cancellation
-        for exc in cancel_exc.exceptions:
-            logger.info(f"Speech worker cancelled: {exc}")
-        raise  # Re-raise to propagate cancellation
-    except* Exception as e:
-        logger.error(f"Speech worker error: {e}\n{traceback.format_exc()}")
+
+async def _acquire_unless_cancelled(
+    ctlr: PipelineController, lookahead: asyncio.Semaphore
+) -> bool:
+    """
+    Take a look-ahead slot, giving up as soon as cancellation is requested.
+
+    Returns:
+        True if a slot was taken and the pipeline has not been cancelled.
+    """
+    if not lookahead.locked():
+        await lookahead.acquire()
+        return not ctlr.is_cancellation_requested()
+
+    # Slots are only freed by playback, which may take seconds per item
+    acquire = asyncio.create_task(lookahead.acquire())
+    cancelled = asyncio.create_task(ctlr.wait_for_cancellation())
+    try:
+        await asyncio.wait((acquire, cancelled), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        acquire.cancel()
+        cancelled.cancel()
+    return (
+        acquire.done()
+        and not acquire.cancelled()
+        and not ctlr.is_cancellation_requested()
+    )
+
+
+async def _play_in_order(
+    voice: Voice,
+    synthesis: asyncio.Task,
+    previous: asyncio.Task | None,
+    lookahead: asyncio.Semaphore,
+):
+    """Play synthesized speech once the previous item has finished playing."""
+    try:
+        audio = await synthesis
+        if previous is not None:
+            await previous
+        await voice.play(audio)
+    finally:
+        lookahead.release()
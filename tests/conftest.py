@@ -0,0 +1,12 @@
+import asyncio
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def eager_tasks():
+    """Run new tasks eagerly so ones that finish without suspending skip the loop."""
+    loop = asyncio.get_running_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(None)
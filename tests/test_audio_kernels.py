@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from input.audio_kernels import pcm16_to_f32_and_rms
+
+
+class TestAudioKernels:
+    def test_pcm16_to_f32_and_rms(self):
+        """Test that conversion and RMS match the two-pass numpy version."""
+        pcm = np.random.default_rng(0).integers(-32768, 32767, 960, dtype=np.int16)
+        dst = np.empty(len(pcm), dtype=np.float32)
+
+        rms = pcm16_to_f32_and_rms(pcm, dst)
+
+        expected = pcm.astype(np.float32) / 32768
+        np.testing.assert_array_equal(dst, expected)
+        assert rms == pytest.approx(np.sqrt(np.mean(np.square(expected))), rel=1e-6)
+
+    def test_pcm16_to_f32_and_rms_empty(self):
+        """Test that empty input has zero RMS."""
+        empty = np.array([], dtype=np.int16)
+        assert pcm16_to_f32_and_rms(empty, np.empty(0, dtype=np.float32)) == 0.0
+
+    def test_pcm16_to_f32_and_rms_full_scale(self):
+        """Test that full-scale int16 samples do not overflow the accumulator."""
+        pcm = np.full(960, -32768, dtype=np.int16)
+        dst = np.empty(len(pcm), dtype=np.float32)
+        assert pcm16_to_f32_and_rms(pcm, dst) == 1.0
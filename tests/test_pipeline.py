@@ -1,41 +1,57 @@
 import asyncio
 import logging
-from unittest.mock import patch
+import os
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
 from model.pipeline import PipelineController
+from model.queue_event import QueuedEventData
 
-# Configure logging for tests
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging for tests, e.g. PYTEST_LOG_LEVEL=DEBUG for verbose output
+logging.basicConfig(level=os.environ.get("PYTEST_LOG_LEVEL", "WARNING"))
+
+
+_TEST_EXC = RuntimeError("Test exception")
+
+
+def _raise_test_exc(*args, **kwargs):
+    raise _TEST_EXC
 
 
 @pytest.fixture
-def pipeline_controller_with_text():
+async def pipeline_controller_with_text():
     """Fixture to provide a fresh PipelineController instance with text input for each test."""
-    return PipelineController(text_input="Test input")
+    pc = PipelineController(text_input="Test input")
+    yield pc
+    await pc.cleanup()
 
 
 @pytest.fixture
-def pipeline_controller_with_audio():
+async def pipeline_controller_with_audio():
     """Fixture to provide a fresh PipelineController instance with audio input for each test."""
-    return PipelineController(audio_data=b"Test audio data")
+    pc = PipelineController(audio_data=b"Test audio data")
+    yield pc
+    await pc.cleanup()
 
 
-class TestPipelineController:
-    """Test suite for the PipelineController class."""
+@pytest.fixture
+def mock_cleanup():
+    """Fixture to patch PipelineController.cleanup for context manager tests."""
+    with patch.object(PipelineController, "cleanup") as mock:
+        yield mock
 
-    def test_initialization_with_text(self, pipeline_controller_with_text):
-        """Test that the PipelineController initializes correctly with text input."""
-        pc = pipeline_controller_with_text
 
-        # Check initial state using accessor methods
-        assert not pc.is_cancellation_requested()  # Initially not set
-        assert not pc.is_completed()  # Initially not set
+class TestPipelineController:
+    """Test suite for the PipelineController class."""
 
-    def test_initialization_with_audio(self, pipeline_controller_with_audio):
-        """Test that the PipelineController initializes correctly with audio input."""
-        pc = pipeline_controller_with_audio
+    @pytest.mark.parametrize(
+        "controller",
+        ["pipeline_controller_with_text", "pipeline_controller_with_audio"],
+    )
+    def test_initialization(self, request, controller):
+        """Test that the PipelineController initializes correctly with text or audio input."""
+        pc = request.getfixturevalue(controller)
 
         # Check initial state using accessor methods
         assert not pc.is_cancellation_requested()  # Initially not set
@@ -68,7 +84,6 @@ class TestPipelineController:
         # Check that completed is set
         assert pc.is_completed()
 
-    @pytest.mark.asyncio
     async def test_is_cancellation_requested(self, pipeline_controller_with_text):
         """Test the is_cancellation_requested method."""
         pc = pipeline_controller_with_text
@@ -91,67 +106,105 @@ class TestPipelineController:
         pc.complete()
         assert pc.is_completed()
 
-    @pytest.mark.asyncio
-    async def test_request_cancellation(self, pipeline_controller_with_text):
+    async def test_request_cancellation(
+        self, pipeline_controller_with_text, monkeypatch
+    ):
         """Test that request_cancellation sets the proper events."""
         pc = pipeline_controller_with_text
 
-        # Use the mock library to patch the private methods
-        with (
-            patch("model.pipeline.asyncio.create_task") as mock_create_task,
-        ):
-            pc.request_cancellation()
+        # Touch the lazily created primitives so there is something to signal
+        _ = pc._audio_event, pc._input_event, pc._speech_queue
+
+        # Record the real tasks so they can be awaited
+        tasks = []
+        monkeypatch.setattr(
+            "model.pipeline.asyncio.create_task",
+            lambda coro: tasks.append(asyncio.ensure_future(coro)) or tasks[-1],
+        )
+        pc.request_cancellation()
+        await asyncio.gather(*tasks)
+
+        # Check that cancel_requested is set
+        assert pc.is_cancellation_requested()
 
-            # Check that cancel_requested is set
-            assert pc.is_cancellation_requested()
+        # Verify that a task was created for each of the two input events
+        assert len(tasks) == 2
+        assert await pc.get_audio_data() is None
+        assert await pc.get_input_text() is None
 
-            # Verify that create_task was called 3 times (for each event)
-            assert mock_create_task.call_count == 3
+        # The speech queue is closed without a task
+        assert await pc.get_from_speech_queue() is None
+
+    async def test_request_cancellation_with_full_speech_queue(self):
+        """Test that request_cancellation wakes a producer blocked on a full speech queue."""
+        pc = PipelineController(text_input="Test input", speech_queue_maxsize=1)
+        await pc.add_to_speech_queue("Response text")
+        put_task = asyncio.create_task(pc.add_to_speech_queue(object()))
+        await asyncio.sleep(0)
+        assert not put_task.done()
+
+        pc.request_cancellation()
+        await pc.cleanup()
+
+        assert pc.is_cancellation_requested()
+        await asyncio.wait_for(put_task, timeout=1.0)
+        assert await pc.get_from_speech_queue() is None
+
+    async def test_request_cancellation_skips_unused_primitives(
+        self, pipeline_controller_with_text, monkeypatch
+    ):
+        """Test that request_cancellation does not create unused events or queues."""
+        pc = pipeline_controller_with_text
+
+        tasks = []
+        monkeypatch.setattr("model.pipeline.asyncio.create_task", tasks.append)
+        pc.request_cancellation()
+
+        assert pc.is_cancellation_requested()
+        assert tasks == []
+        assert not pc._materialized("_speech_queue")
 
-    @pytest.mark.asyncio
     async def test_cleanup(self, pipeline_controller_with_text):
         """Test the cleanup method."""
         pc = pipeline_controller_with_text
 
-        # Mock the private attributes with patch to verify internal behavior
-        with (
-            patch.object(pc, "_speech_queue") as mock_speech_queue,
-            patch.object(pc, "_input_event") as mock_input_event,
-            patch.object(pc, "_audio_event") as mock_audio_event,
-            patch.object(pc, "_completed") as mock_completed,
-        ):
-            mock_completed.is_set.return_value = False
+        # Mock the private attributes in one patch to verify internal behavior
+        with patch.multiple(
+            pc,
+            _speech_queue=DEFAULT,
+            _input_event=DEFAULT,
+            _audio_event=DEFAULT,
+            _completed=DEFAULT,
+        ) as mocks:
+            mocks["_completed"].is_set.return_value = False
 
             # Execute cleanup
             await pc.cleanup()
 
-            # Verify resets were called
-            mock_speech_queue.reset.assert_called_once()
-            mock_input_event.reset.assert_called_once()
-            mock_audio_event.reset.assert_called_once()
+            # Verify resets were called, and the speech queue stays closed
+            mocks["_speech_queue"].close.assert_called_once()
+            mocks["_input_event"].reset.assert_called_once()
+            mocks["_audio_event"].reset.assert_called_once()
 
             # Check completed is set
-            mock_completed.set.assert_called_once()
+            mocks["_completed"].set.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_cleanup_with_exception(self, pipeline_controller_with_text):
+    async def test_cleanup_with_exception(
+        self, pipeline_controller_with_text, monkeypatch
+    ):
         """Test that cleanup handles exceptions properly."""
         pc = pipeline_controller_with_text
+        _ = pc._speech_queue
 
-        # Set up mocks to raise exceptions
-        with (
-            patch.object(
-                pc._speech_queue, "reset", side_effect=Exception("Test exception")
-            ),
-            patch("model.pipeline.logger.error") as mock_logger,
-        ):
+        # Slotted instances cannot be patched, so stub the method on the class
+        monkeypatch.setattr(QueuedEventData, "close", _raise_test_exc)
+        with patch("model.pipeline.logger.error") as mock_logger:
             # Execute cleanup
             await pc.cleanup()
 
             # Verify logger was called to log the error
             assert mock_logger.called
 
-    @pytest.mark.asyncio
     async def test_event_flow(self, pipeline_controller_with_text):
         """Test the flow of events through the pipeline."""
         pc = pipeline_controller_with_text
@@ -176,7 +229,6 @@ class TestPipelineController:
         assert input_text == test_input_text
         assert speech_text == test_speech_text
 
-    @pytest.mark.asyncio
     async def test_wait_for_completion(self, pipeline_controller_with_text):
         """Test the wait_for_completion method."""
         pc = pipeline_controller_with_text
@@ -185,48 +237,46 @@ class TestPipelineController:
         wait_task = asyncio.create_task(pc.wait_for_completion())
 
         # Ensure the task is not done yet
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)
         assert not wait_task.done()
 
         # Complete the pipeline
         pc.complete()
 
-        # Allow the task to process
-        await asyncio.sleep(0.1)
-
-        # Verify the task is now done
-        assert wait_task.done()
-
-    @pytest.mark.asyncio
-    async def test_context_manager_with_text(self):
-        """Test that the PipelineController works as a context manager with text input."""
-        # Setup mock for cleanup method
-        with patch.object(PipelineController, "cleanup") as mock_cleanup:
-            # Use the controller as a context manager
-            async with PipelineController(text_input="Test input") as pc:
-                # Check that the controller is initialized
-                assert pc is not None
-                assert isinstance(pc, PipelineController)
-
-                # Check that cleanup hasn't been called yet
-                mock_cleanup.assert_not_called()
-
-            # After exiting the context, cleanup should be called
-            mock_cleanup.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_context_manager_with_audio(self):
-        """Test that the PipelineController works as a context manager with audio input."""
-        # Setup mock for cleanup method
-        with patch.object(PipelineController, "cleanup") as mock_cleanup:
-            # Use the controller as a context manager
-            async with PipelineController(audio_data=b"Test audio data") as pc:
-                # Check that the controller is initialized
-                assert pc is not None
-                assert isinstance(pc, PipelineController)
-
-                # Check that cleanup hasn't been called yet
-                mock_cleanup.assert_not_called()
-
-            # After exiting the context, cleanup should be called
-            mock_cleanup.assert_called_once()
+        # Verify the task finishes as soon as the event fires
+        await asyncio.wait_for(wait_task, timeout=1.0)
+
+    async def test_wait_terminal(self, pipeline_controller_with_text):
+        """Test that wait_terminal returns on completion or cancellation."""
+        pc = pipeline_controller_with_text
+
+        wait_task = asyncio.create_task(pc.wait_terminal())
+        await asyncio.sleep(0)
+        assert not wait_task.done()
+
+        pc.complete()
+        await asyncio.wait_for(wait_task, timeout=1.0)
+
+        pc = PipelineController(text_input="Test input")
+        wait_task = asyncio.create_task(pc.wait_terminal())
+        await asyncio.sleep(0)
+
+        pc.request_cancellation()
+        await asyncio.wait_for(wait_task, timeout=1.0)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"text_input": "Test input"}, {"audio_data": b"Test audio data"}]
+    )
+    async def test_context_manager(self, mock_cleanup, kwargs):
+        """Test that the PipelineController works as a context manager with text or audio input."""
+        # Use the controller as a context manager
+        async with PipelineController(**kwargs) as pc:
+            # Check that the controller is initialized
+            assert pc is not None
+            assert isinstance(pc, PipelineController)
+
+            # Check that cleanup hasn't been called yet
+            mock_cleanup.assert_not_called()
+
+        # After exiting the context, cleanup should be called
+        mock_cleanup.assert_called_once()
@@ -0,0 +1,101 @@
+import asyncio
+
+from model.queue_event import MAX_COALESCED_CHUNKS, QueuedEventData
+
+
+class TestQueuedEventData:
+    """Test suite for the QueuedEventData class."""
+
+    async def test_reset_discards_pending_items(self):
+        """Test that reset drops every queued item."""
+        queue = QueuedEventData()
+        await queue.put("first")
+        await queue.put("second")
+
+        queue.reset()
+
+        assert queue.get_nowait() is None
+
+    async def test_reset_wakes_blocked_getter(self):
+        """Test that reset releases a consumer waiting on the old queue."""
+        queue = QueuedEventData()
+        get_task = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        queue.reset()
+
+        assert await asyncio.wait_for(get_task, timeout=1.0) is None
+
+    async def test_put_coalesces_pending_text(self):
+        """Test that consecutive text chunks are merged into one item."""
+        queue = QueuedEventData()
+        await queue.put("Hello.")
+        await queue.put("How are you?")
+        await queue.put("Fine.")
+
+        assert await queue.get() == "Hello.\nHow are you?\nFine."
+        assert queue.get_nowait() is None
+
+    async def test_put_does_not_coalesce_across_boundaries(self):
+        """Test that consumed items and sentinels start a new item."""
+        queue = QueuedEventData()
+        await queue.put("first")
+        assert await queue.get() == "first"
+
+        await queue.put("second")
+        await queue.put(None)
+        await queue.put("third")
+
+        assert queue.get_nowait() == "second"
+        assert queue.get_nowait() is None
+        assert queue.get_nowait() == "third"
+
+    async def test_put_blocks_once_coalesced_item_is_full(self):
+        """Test that a full bounded queue throttles the producer."""
+        queue = QueuedEventData(maxsize=1)
+        for i in range(MAX_COALESCED_CHUNKS):
+            await queue.put(f"chunk {i}")
+
+        put_task = asyncio.create_task(queue.put("overflow"))
+        await asyncio.sleep(0)
+        assert not put_task.done()
+
+        assert await queue.get() == "\n".join(
+            f"chunk {i}" for i in range(MAX_COALESCED_CHUNKS)
+        )
+        await asyncio.wait_for(put_task, timeout=1.0)
+        assert await queue.get() == "overflow"
+
+    async def test_close_wakes_all_blocked_getters(self):
+        """Test that close releases every waiting consumer with None."""
+        queue = QueuedEventData()
+        get_tasks = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        queue.close()
+
+        results = await asyncio.wait_for(asyncio.gather(*get_tasks), timeout=1.0)
+        assert results == [None, None, None]
+
+    async def test_close_discards_pending_items(self):
+        """Test that items queued before or after close are dropped."""
+        queue = QueuedEventData()
+        await queue.put("pending")
+
+        queue.close()
+        await queue.put("dropped")
+
+        assert await queue.get() is None
+
+    async def test_close_wakes_all_blocked_producers(self):
+        """Test that close releases every producer waiting on a full queue."""
+        queue = QueuedEventData(maxsize=1)
+        await queue.put(0)
+        put_tasks = [asyncio.create_task(queue.put(i)) for i in range(1, 4)]
+        await asyncio.sleep(0)
+        assert not any(task.done() for task in put_tasks)
+
+        queue.close()
+
+        await asyncio.wait_for(asyncio.gather(*put_tasks), timeout=1.0)
+        assert queue.get_nowait() is None
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+import tasks
+from model.pipeline import PipelineController
+from tasks import SENTINEL, chat_worker, input_worker, speech_worker
+
+
+class _FailingInput:
+    """Input handler that raises the given errors before succeeding."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def receive(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+class TestInputWorker:
+    """Test suite for the input_worker task."""
+
+    async def test_retries_transient_errors(self, monkeypatch):
+        """Test that OSErrors are retried until receive succeeds."""
+        monkeypatch.setattr(tasks, "INPUT_RETRY_BACKOFF", 0.0)
+        handler = _FailingInput(OSError("device busy"), OSError("device busy"))
+
+        await input_worker(handler, is_voice_input=False)
+
+        assert handler.calls == 3
+
+    async def test_propagates_eof(self):
+        """Test that EOFError ends the worker instead of being retried."""
+        handler = _FailingInput(EOFError())
+
+        with pytest.raises(EOFError):
+            await input_worker(handler, is_voice_input=False)
+
+        assert handler.calls == 1
+
+
+class _EndlessChatAgent:
+    """Chat agent that keeps streaming until it is cancelled."""
+
+    async def chat(self, message):
+        while True:
+            yield message
+            await asyncio.sleep(0.01)
+
+
+class TestChatWorker:
+    """Test suite for the chat_worker task."""
+
+    async def test_sibling_failure_cancels_cleanly(self):
+        """Test that a TaskGroup failure leaves the chat worker cancelled, not failed."""
+        ctlr = PipelineController(text_input="Test input")
+
+        async def fail():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("speech failed")
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            async with ctlr, asyncio.TaskGroup() as tg:
+                chat = tg.create_task(chat_worker(ctlr, _EndlessChatAgent()))
+                tg.create_task(fail())
+
+        assert chat.cancelled()
+        assert exc_info.group_contains(RuntimeError)
+
+
+class _StubVoice:
+    """Voice that synthesizes after a per-text delay and records playback."""
+
+    def __init__(self, synthesis_delays=None, play_delay=0.0):
+        self.synthesis_delays = synthesis_delays or {}
+        self.play_delay = play_delay
+        self.started = []
+        self.played = []
+        self.cancelled = []
+
+    async def synthesize(self, text):
+        await asyncio.sleep(self.synthesis_delays.get(text, 0.0))
+        return text
+
+    async def play(self, audio):
+        self.started.append(audio)
+        try:
+            await asyncio.sleep(self.play_delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(audio)
+            raise
+        self.played.append(audio)
+
+
+async def _feed(ctlr, *items):
+    for item in items:
+        await ctlr.add_to_speech_queue(item)
+        # Let the worker take each item so consecutive texts are not coalesced
+        await asyncio.sleep(0)
+
+
+class TestSpeechWorker:
+    """Test suite for the speech_worker task."""
+
+    async def test_plays_in_order_and_stops_on_sentinel(self):
+        """Test that items play in queue order even when synthesized out of order."""
+        ctlr = PipelineController(text_input="Test input")
+        voice = _StubVoice(synthesis_delays={"first": 0.03, "second": 0.01})
+        worker = asyncio.create_task(speech_worker(ctlr, voice))
+
+        await _feed(ctlr, "first", "second", "third", SENTINEL)
+        await asyncio.wait_for(worker, timeout=1.0)
+
+        assert voice.played == ["first", "second", "third"]
+        assert ctlr.is_completed()
+
+    async def test_stops_promptly_on_cancellation(self):
+        """Test that request_cancellation cancels synthesis and playback in flight."""
+        ctlr = PipelineController(text_input="Test input")
+        voice = _StubVoice(synthesis_delays={"second": 10.0}, play_delay=10.0)
+        worker = asyncio.create_task(speech_worker(ctlr, voice))
+
+        await _feed(ctlr, "first", "second")
+        while not voice.started:
+            await asyncio.sleep(0)
+
+        ctlr.request_cancellation()
+        await asyncio.wait_for(worker, timeout=1.0)
+
+        assert voice.played == []
+        assert voice.cancelled == ["first"]
+        assert ctlr.is_completed()
+
+    async def test_stops_promptly_with_full_lookahead(self):
+        """Test that cancellation stops a worker waiting for a look-ahead slot."""
+        ctlr = PipelineController(text_input="Test input")
+        voice = _StubVoice(play_delay=10.0)
+        worker = asyncio.create_task(speech_worker(ctlr, voice))
+
+        await _feed(ctlr, "a", "b", "c", "d", "e")
+        while not voice.started:
+            await asyncio.sleep(0)
+
+        # What run_pipeline_cycle does once wait_terminal() returns
+        ctlr.request_cancellation()
+        await ctlr.cleanup()
+        await asyncio.wait_for(worker, timeout=1.0)
+
+        assert voice.played == []
+        assert voice.cancelled == ["a"]
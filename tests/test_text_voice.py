@@ -0,0 +1,17 @@
+import io
+import sys
+
+from speech.text import TextVoice
+
+
+class TestTextVoice:
+    """Test suite for the TextVoice class."""
+
+    async def test_say_writes_without_file_descriptor(self, monkeypatch):
+        """Test that text is written when stdout has no file descriptor."""
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        await TextVoice().say("Hello")
+
+        assert stdout.getvalue() == "TextVoice: Hello\n"